@@ -1,8 +1,33 @@
 """Configuration Manager module for Disk Cleaner."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Protocol
+from typing import Dict, Any, List, Optional, Protocol, Tuple
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+import copy
+import glob
 import os
+import shutil
+import tempfile
+import time
+
+import yaml
+
+# Number of timestamped backups kept next to a saved configuration file
+MAX_CONFIG_BACKUPS = 5
+
+# A modification time this close to the moment it was read is not trusted as
+# a cache signature: a further change within the same timestamp tick (2 s on
+# FAT) would leave it unchanged. Same idea as git's racy-index rule.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Prefer the libyaml-backed C implementations when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
 
 class ConfigurationSource(Protocol):
@@ -13,50 +38,77 @@ class ConfigurationSource(Protocol):
         ...
 
 
+def _is_racy_mtime(mtime_ns: int, now_ns: int) -> bool:
+    """Whether mtime_ns is too recent, as of now_ns, to vouch for unchanged content."""
+    return now_ns - mtime_ns < RACY_MTIME_WINDOW_NS
+
+
+@lru_cache(maxsize=1)
+def _default_scan_paths() -> Tuple[str, ...]:
+    """Resolve the default scan locations once per process."""
+    home = os.environ.get('USERPROFILE') or os.path.expanduser('~')
+    return (
+        os.path.join(home, 'Documents'),
+        os.path.join(home, 'Downloads'),
+        os.path.join(home, 'Desktop')
+    )
+
+
+# Read-only template for DefaultConfigurationSource. Lists are stored as
+# tuples so nothing reachable from the template can be mutated; the user
+# profile paths are filled in per call from _default_scan_paths().
+_DEFAULT_CONFIG = MappingProxyType({
+    'scan': MappingProxyType({
+        'exclude_patterns': (
+            '**/.git/**',
+            '**/__pycache__/**',
+            '**/node_modules/**'
+        ),
+        'max_depth': 10,
+        'follow_symlinks': False
+    }),
+    'performance': MappingProxyType({
+        'mode': 'background',
+        'max_threads': 4,
+        'memory_limit_mb': 1024,
+        'cpu_limit_percent': 80,
+        'io_throttling': True
+    }),
+    'classification': MappingProxyType({
+        'temp_file_age_days': 30,
+        'large_file_threshold_mb': 500,
+        'dev_folder_min_size_mb': 50,
+        'exclude_extensions': ('.tmp', '.bak', '.old')
+    }),
+    'ui': MappingProxyType({
+        'theme': 'auto',
+        'show_progress': True,
+        'verbose_logging': False,
+        'color_output': True
+    })
+})
+
+
 class DefaultConfigurationSource:
     """Provides default configuration values."""
 
     def load(self) -> Dict[str, Any]:
         """Generate default configuration for the disk cleaner.
 
+        A fresh, mutable copy of the module-level template is returned on
+        every call so callers may modify it. The template is only two levels
+        deep, so a direct copy is used instead of copy.deepcopy().
+
         Returns:
             Dictionary containing default configuration values
         """
-        return {
-            'scan': {
-                'paths': [
-                    os.path.expandvars(r'%USERPROFILE%\Documents'),
-                    os.path.expandvars(r'%USERPROFILE%\Downloads'),
-                    os.path.expandvars(r'%USERPROFILE%\Desktop')
-                ],
-                'exclude_patterns': [
-                    '**/.git/**',
-                    '**/__pycache__/**',
-                    '**/node_modules/**'
-                ],
-                'max_depth': 10,
-                'follow_symlinks': False
-            },
-            'performance': {
-                'mode': 'background',
-                'max_threads': 4,
-                'memory_limit_mb': 1024,
-                'cpu_limit_percent': 80,
-                'io_throttling': True
-            },
-            'classification': {
-                'temp_file_age_days': 30,
-                'large_file_threshold_mb': 500,
-                'dev_folder_min_size_mb': 50,
-                'exclude_extensions': ['.tmp', '.bak', '.old']
-            },
-            'ui': {
-                'theme': 'auto',
-                'show_progress': True,
-                'verbose_logging': False,
-                'color_output': True
-            }
+        config = {
+            section: {key: list(value) if isinstance(value, tuple) else value
+                      for key, value in settings.items()}
+            for section, settings in _DEFAULT_CONFIG.items()
         }
+        config['scan'] = {'paths': list(_default_scan_paths()), **config['scan']}
+        return config
 
 
 class ConfigurationValidator(ABC):
@@ -75,28 +127,36 @@ class ConfigurationValidator(ABC):
         pass
 
 
+# Validation schema, defined once and shared by every validator instance
+_REQUIRED_SECTIONS = ('scan', 'performance', 'classification', 'ui')
+
+# (section, key, check, error message) for optional settings
+_SETTING_RULES = (
+    ('performance', 'max_threads',
+     lambda value: isinstance(value, int) and 1 <= value <= 16,
+     "max_threads must be an integer between 1 and 16"),
+    ('performance', 'memory_limit_mb',
+     lambda value: isinstance(value, int) and value > 0,
+     "memory_limit_mb must be a positive integer"),
+)
+
+
 class BasicConfigurationValidator(ConfigurationValidator):
     """Basic validator for configuration data."""
 
     def validate(self, config: Dict[str, Any]) -> None:
         """Validate configuration data."""
-        required_sections = ['scan', 'performance', 'classification', 'ui']
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in config:
                 raise ValueError(f"Missing required configuration section: {section}")
 
             if not isinstance(config[section], dict):
                 raise ValueError(f"Configuration section '{section}' must be a dictionary")
 
-        # Validate performance settings
-        perf = config['performance']
-        if 'max_threads' in perf:
-            if not isinstance(perf['max_threads'], int) or not (1 <= perf['max_threads'] <= 16):
-                raise ValueError("max_threads must be an integer between 1 and 16")
-
-        if 'memory_limit_mb' in perf:
-            if not isinstance(perf['memory_limit_mb'], int) or perf['memory_limit_mb'] <= 0:
-                raise ValueError("memory_limit_mb must be a positive integer")
+        for section, key, check, message in _SETTING_RULES:
+            settings = config[section]
+            if key in settings and not check(settings[key]):
+                raise ValueError(message)
 
 
 class ConfigurationManager:
@@ -113,6 +173,15 @@ class ConfigurationManager:
         """
         self._config_source = config_source or DefaultConfigurationSource()
         self._validator = validator or BasicConfigurationValidator()
+        # Parsed files keyed by path, tagged with the (mtime_ns, size) they were read at
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # Config files found per search location, tagged with the location's mtime_ns
+        self._discovery_cache: Dict[str, Tuple[Optional[int], List[Path]]] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached configuration discovery and parse results."""
+        self._file_cache.clear()
+        self._discovery_cache.clear()
 
     def get_default_configuration(self) -> Dict[str, Any]:
         """Generate default configuration for the disk cleaner.
@@ -138,21 +207,30 @@ class ConfigurationManager:
             # Validate configuration before saving
             self._validator.validate(config)
 
-            # Create backup if file exists
+            # Create backup if file exists; a hard link avoids copying the data
+            # because the atomic replace below gives config_path a new inode
             if config_path.exists():
                 backup_path = config_path.with_suffix(f'.backup.{int(datetime.now().timestamp())}{config_path.suffix}')
-                shutil.copy2(config_path, backup_path)
+                try:
+                    os.link(config_path, backup_path)
+                except OSError:
+                    shutil.copy2(config_path, backup_path)
 
             # Ensure parent directory exists
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write to temporary file first (atomic write)
             with tempfile.NamedTemporaryFile(mode='w', suffix=config_path.suffix, delete=False, dir=config_path.parent) as temp_file:
-                yaml.dump(config, temp_file, default_flow_style=False, sort_keys=False)
                 temp_path = Path(temp_file.name)
+                yaml.dump(config, temp_file, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+                # Make the new content durable before it replaces the old file
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
 
             # Atomic move to final location
             temp_path.replace(config_path)
+            self.invalidate()
+            self._prune_backups(config_path)
             return True
 
         except Exception:
@@ -161,9 +239,38 @@ class ConfigurationManager:
                 temp_path.unlink()
             return False
 
+    def _prune_backups(self, config_path: Path) -> None:
+        """Delete all but the newest MAX_CONFIG_BACKUPS backups of a config file.
+
+        Args:
+            config_path: Path of the configuration file whose backups to prune
+        """
+        prefix = f"{config_path.stem}.backup."
+        suffix = config_path.suffix
+        backups = []
+        for backup_path in config_path.parent.glob(f"{glob.escape(prefix)}*{glob.escape(suffix)}"):
+            timestamp = backup_path.name[len(prefix):len(backup_path.name) - len(suffix)]
+            if timestamp.isdigit():
+                backups.append((int(timestamp), backup_path))
+
+        backups.sort()
+        for _, backup_path in backups[:-MAX_CONFIG_BACKUPS]:
+            try:
+                backup_path.unlink()
+            except OSError:
+                # A backup we cannot remove is left for the next save
+                pass
+
     def _discover_config_files(self) -> list[Path]:
         """Discover configuration files in standard locations.
 
+        Each search location is stat()ed once; its config file candidates are
+        only re-checked when the directory's modification time has changed,
+        which happens whenever a file in it is created, removed or renamed.
+        A directory modified within RACY_MTIME_WINDOW_NS of the stat is
+        always re-checked and not cached, since a file created in the same
+        timestamp tick would leave its mtime unchanged.
+
         Returns:
             List of paths to potential configuration files
         """
@@ -183,19 +290,76 @@ class ConfigurationManager:
         # Possible configuration file names
         config_names = ['config.yaml', 'config.yml', 'config.json']
 
+        # Read before the stat() calls, so the racy check errs on the safe side
+        now_ns = time.time_ns()
         for location in search_locations:
-            location_path = Path(location)
-            if location_path.exists():
+            location = os.fspath(location)
+            try:
+                mtime_ns = os.stat(location).st_mtime_ns
+            except OSError:
+                mtime_ns = None  # Location does not exist
+
+            racy = mtime_ns is not None and _is_racy_mtime(mtime_ns, now_ns)
+            cached = None if racy else self._discovery_cache.get(location)
+            if cached is not None and cached[0] == mtime_ns:
+                config_paths.extend(cached[1])
+                continue
+
+            found = []
+            if mtime_ns is not None:
+                # Probe candidates as strings; only hits become Path objects
                 for config_name in config_names:
-                    config_path = location_path / config_name
-                    if config_path.exists():
-                        config_paths.append(config_path)
+                    candidate = os.path.join(location, config_name)
+                    if os.path.isfile(candidate):
+                        found.append(Path(candidate))
+
+            if racy:
+                self._discovery_cache.pop(location, None)
+            else:
+                self._discovery_cache[location] = (mtime_ns, found)
+            config_paths.extend(found)
 
         return config_paths
 
     def _read_config_file(self, config_path: Path) -> Dict[str, Any]:
         """Read and parse a configuration file.
 
+        Parsed results are cached and reused while the file's modification
+        time and size are unchanged. A file modified within
+        RACY_MTIME_WINDOW_NS of the stat is parsed without caching, since a
+        same-size rewrite in the same timestamp tick would match its signature.
+
+        Args:
+            config_path: Path to the configuration file
+
+        Returns:
+            Dictionary containing parsed configuration
+
+        Raises:
+            ValueError: If file cannot be read or parsed
+        """
+        now_ns = time.time_ns()
+        try:
+            stat = os.stat(config_path)
+        except OSError as e:
+            raise ValueError(f"Cannot read configuration file {config_path}: {e}")
+
+        if _is_racy_mtime(stat.st_mtime_ns, now_ns):
+            self._file_cache.pop(config_path, None)
+            return self._parse_config_file(config_path)
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(config_path)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        config = self._parse_config_file(config_path)
+        self._file_cache[config_path] = (signature, config)
+        return copy.deepcopy(config)
+
+    def _parse_config_file(self, config_path: Path) -> Dict[str, Any]:
+        """Parse a YAML or JSON configuration file without caching.
+
         Args:
             config_path: Path to the configuration file
 
@@ -213,7 +377,7 @@ class ConfigurationManager:
                 content = f.read()
 
             if config_path.suffix.lower() in ['.yaml', '.yml']:
-                return yaml.safe_load(content)
+                return yaml.load(content, Loader=_YamlLoader)
             elif config_path.suffix.lower() == '.json':
                 return json.loads(content)
             else:
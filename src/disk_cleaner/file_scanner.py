@@ -1,23 +1,150 @@
 """File System Scanner module for Disk Cleaner."""
 
 from abc import ABC, abstractmethod
-from typing import Iterator, List, Optional
+from typing import Any, Callable, FrozenSet, Iterator, List, Optional, Pattern, Tuple
 from pathlib import Path
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing, contextmanager
+from itertools import chain
+from stat import FILE_ATTRIBUTE_HIDDEN, FILE_ATTRIBUTE_SYSTEM, S_ISDIR, S_ISREG
+import fnmatch
 import os
-from dataclasses import dataclass
+import re
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+import time
+
+# Optional: vectorizes ScanResult queries when installed
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+# Directories that must be queued before a parallel walk hands work to the
+# thread pool; narrower trees are cheaper to read on the calling thread.
+PARALLEL_MIN_PENDING_DIRS = 4
+
+# Directory reads kept in flight per worker thread. Bounding the submitted
+# tasks keeps finished-but-unconsumed listings from piling up on wide trees.
+PARALLEL_TASKS_PER_WORKER = 4
+
+# Where scandir() accepts a descriptor, directories are read through one, so
+# DirEntry.stat() becomes fstatat() on the bare name instead of resolving the
+# entry's full path from the root again.
+_SCANDIR_BY_FD = os.scandir in os.supports_fd and os.stat in os.supports_dir_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
 
 
 @dataclass
 class FileInfo:
     """Information about a file or directory."""
-    path: Path
+
+    # Declared by hand (dataclass(slots=True) needs Python 3.10) so the many
+    # instances created during a scan carry no per-instance __dict__.
+    # The underscored slots cache values derived on first access.
+    __slots__ = ('parent', 'name', 'size_bytes', 'modified_ns', 'created_ns',
+                 'is_directory', 'attributes', 'device', 'inode', '_path',
+                 '_modified_time', '_created_time')
+
+    parent: str  # Directory path, one string object shared by its entries
+    name: str
     size_bytes: int
-    modified_time: datetime
-    created_time: datetime
+    modified_ns: int  # st_mtime_ns: exact, and an int costs less than a float
+    created_ns: int  # st_ctime_ns (creation time on Windows)
     is_directory: bool
-    attributes: Optional[object] = None  # For Windows file attributes
-    hash_seed: Optional[str] = None  # For duplicate detection optimization
+    attributes: Optional[int]  # Windows st_file_attributes bits, None elsewhere
+    device: int  # st_dev from the scan's stat(), so callers need not stat again
+    inode: int  # st_ino; 0 where the platform's scandir does not report it
+
+    @property
+    def path_str(self) -> str:
+        """Full path of the file as a string."""
+        return os.path.join(self.parent, self.name)
+
+    @property
+    def path(self) -> Path:
+        """Path object for the file, constructed on first access."""
+        try:
+            return self._path
+        except AttributeError:
+            self._path = Path(self.path_str)
+            return self._path
+
+    @property
+    def modified_ts(self) -> float:
+        """POSIX timestamp of last modification, in seconds."""
+        return self.modified_ns / 1e9
+
+    @property
+    def created_ts(self) -> float:
+        """POSIX timestamp of creation (st_ctime), in seconds."""
+        return self.created_ns / 1e9
+
+    @property
+    def modified_time(self) -> datetime:
+        """Last modification time as a local datetime."""
+        try:
+            return self._modified_time
+        except AttributeError:
+            self._modified_time = datetime.fromtimestamp(self.modified_ts)
+            return self._modified_time
+
+    @property
+    def created_time(self) -> datetime:
+        """Creation time as a local datetime."""
+        try:
+            return self._created_time
+        except AttributeError:
+            self._created_time = datetime.fromtimestamp(self.created_ts)
+            return self._created_time
+
+    @property
+    def is_hidden(self) -> bool:
+        """Whether the Windows hidden attribute is set (always False elsewhere)."""
+        return bool(self.attributes and self.attributes & FILE_ATTRIBUTE_HIDDEN)
+
+    @property
+    def is_system(self) -> bool:
+        """Whether the Windows system attribute is set (always False elsewhere)."""
+        return bool(self.attributes and self.attributes & FILE_ATTRIBUTE_SYSTEM)
+
+    @property
+    def file_id(self) -> Optional[Tuple[int, int]]:
+        """Identity of the underlying file, shared by all of its hard links.
+
+        Returns:
+            Tuple of device and inode numbers, or None when the scan could
+            not determine them
+        """
+        if not self.inode:
+            return None
+        return self.device, self.inode
+
+    @property
+    def duplicate_key(self) -> Tuple[str, int, int]:
+        """Identifying metadata for grouping duplicate candidates.
+
+        Returns:
+            Tuple of file name, size in bytes and modification time in
+            nanoseconds, which compares exactly
+        """
+        return self.name, self.size_bytes, self.modified_ns
+
+    @property
+    def hash_seed(self) -> int:
+        """Seed for duplicate detection, computed only when requested.
+
+        Hashes duplicate_key; the value is stable within a process, which
+        is all duplicate grouping needs.
+
+        Returns:
+            Integer hash of the file's identifying metadata
+        """
+        return hash(self.duplicate_key)
 
     def is_large_file(self, threshold_mb: int = 100) -> bool:
         """Check if file is considered large based on size threshold.
@@ -31,13 +158,17 @@ class FileInfo:
         threshold_bytes = threshold_mb * 1024 * 1024
         return self.size_bytes > threshold_bytes
 
-    def get_age_days(self) -> int:
+    def get_age_days(self, now: Optional[float] = None) -> int:
         """Get the age of the file in days since modification.
 
+        Args:
+            now: Reference POSIX timestamp (defaults to the current time);
+                pass one value when ageing many files to read the clock once
+
         Returns:
             Number of days since last modification
         """
-        return (datetime.now() - self.modified_time).days
+        return int(((time.time() if now is None else now) - self.modified_ts) / 86400.0)
 
 
 @dataclass
@@ -48,6 +179,8 @@ class ScanConfig:
     exclude_patterns: List[str] = None
     min_file_size_bytes: int = 0
     exclude_extensions: List[str] = None
+    max_threads: int = 1  # Mirrors performance.max_threads; 1 disables the pool
+    case_sensitive_extensions: bool = False  # Match exclude_extensions exactly as given
 
     def __post_init__(self):
         """Initialize mutable defaults."""
@@ -57,19 +190,245 @@ class ScanConfig:
             self.exclude_extensions = []
 
 
+@dataclass(frozen=True)
+class _CompiledFilters:
+    """Exclusion settings of a ScanConfig in the form the walk checks them.
+
+    Patterns without wildcards become a set lookup, '*x' and 'x*' become
+    str.endswith/startswith tuples, the rest share one combined regex, and
+    extensions become a normalized set, so each file costs one hash probe
+    however many extensions are excluded.
+    """
+
+    __slots__ = ('literals', 'endings', 'prefixes', 'exclude_re', 'prune_re', 'suffixes')
+
+    literals: FrozenSet[str]
+    endings: Tuple[str, ...]
+    prefixes: Tuple[str, ...]
+    exclude_re: Optional[Pattern[str]]
+    prune_re: Optional[Pattern[str]]  # Tried against directory paths ending in a separator
+    suffixes: FrozenSet[str]
+
+
+def _config_filters(config: ScanConfig) -> _CompiledFilters:
+    """Compile the exclusion settings a ScanConfig holds right now.
+
+    Called once per walk rather than at construction, so later changes to
+    the config's fields take effect; the compilation itself is cached.
+    """
+    return _compile_filters(tuple(config.exclude_patterns or ()),
+                            tuple(config.exclude_extensions or ()),
+                            config.case_sensitive_extensions)
+
+
+_GLOB_MAGIC = re.compile(r'[*?[]')
+_ENDING_GLOB = re.compile(r'\*([^*?[]+)')
+_PREFIX_GLOB = re.compile(r'([^*?[]+)\*')
+
+
+@lru_cache(maxsize=64)
+def _compile_filters(patterns: Tuple[str, ...], extensions: Tuple[str, ...],
+                     case_sensitive_extensions: bool = False) -> _CompiledFilters:
+    """Compile exclusion settings into the structures the walk checks.
+
+    A pattern without wildcards only matches a path equal to it, so it is
+    kept in a set for an exact lookup instead of going through the regex.
+    Since ``*`` also matches separators, ``*x`` matches exactly the paths
+    ending in ``x`` and ``x*`` those starting with ``x``; such patterns are
+    tested with str.endswith/startswith, which never enter the regex engine.
+
+    A pattern ending in ``*`` that matches ``dir/`` matches every path below
+    that directory too, since the final ``*`` absorbs the rest. Such patterns
+    (e.g. ``cache/**``) therefore also go into a pruning regex that is tried
+    against directory paths with a trailing separator, so excluded subtrees
+    are never read.
+
+    Cached on the settings themselves, so configurations built repeatedly
+    (watch mode, incremental scans) share one compiled state and need no
+    invalidation. The result is immutable, since it is shared.
+
+    Args:
+        patterns: Glob exclusion patterns
+        extensions: Excluded file extensions, with or without the leading dot
+        case_sensitive_extensions: Keep the extensions' case instead of
+            lowercasing them
+
+    Returns:
+        The case-normalized literal patterns, path endings, path prefixes,
+        the combined regex for the remaining patterns, the directory pruning
+        regex (each regex None if no pattern qualifies) and the extension
+        set, normalized to ``Path.suffix`` form
+    """
+    suffixes = frozenset('.' + ext.lstrip('.') for ext in extensions)
+    if not case_sensitive_extensions:
+        suffixes = frozenset(ext.lower() for ext in suffixes)
+    normalized = [os.path.normcase(pattern) for pattern in patterns]
+    literals = frozenset(p for p in normalized if not _GLOB_MAGIC.search(p))
+    globs = [p for p in normalized if p not in literals]
+    endings = tuple(m.group(1) for m in map(_ENDING_GLOB.fullmatch, globs) if m)
+    prefixes = tuple(m.group(1) for m in map(_PREFIX_GLOB.fullmatch, globs) if m)
+    others = [p for p in globs
+              if not _ENDING_GLOB.fullmatch(p) and not _PREFIX_GLOB.fullmatch(p)]
+    prunable = [p for p in globs if p.endswith('*')]
+    return _CompiledFilters(literals=literals, endings=endings, prefixes=prefixes,
+                            exclude_re=_compile_globs(others),
+                            prune_re=_compile_globs(prunable), suffixes=suffixes)
+
+
+def _compile_globs(patterns: List[str]) -> Optional[Pattern[str]]:
+    """Combine glob patterns into one regex alternation, or None if empty."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in patterns))
+
+
+@dataclass
+class ScanResult:
+    """Scan results stored column-wise for bulk queries.
+
+    Sizes, nanosecond timestamps, attribute bits and file identities live
+    in typed ``array.array`` columns instead of being spread across FileInfo
+    objects, which keeps large results compact. The columns expose the
+    buffer protocol, so when NumPy is installed the size and age queries
+    wrap them without copying and compare in one vectorized pass; without
+    it they are plain Python loops, no faster than over FileInfo objects.
+    """
+    paths: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('q'))
+    mtimes_ns: array = field(default_factory=lambda: array('q'))
+    ctimes_ns: array = field(default_factory=lambda: array('q'))
+    attributes: array = field(default_factory=lambda: array('I'))  # 0 where unavailable
+    devices: array = field(default_factory=lambda: array('Q'))
+    inodes: array = field(default_factory=lambda: array('Q'))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[FileInfo]:
+        """Rebuild a FileInfo for each row, for code written against the object API."""
+        split = os.path.split
+        for path_str, size, mtime_ns, ctime_ns, attributes, device, inode in zip(
+                self.paths, self.sizes, self.mtimes_ns, self.ctimes_ns,
+                self.attributes, self.devices, self.inodes):
+            parent, name = split(path_str)
+            yield FileInfo(parent=parent, name=name, size_bytes=size, modified_ns=mtime_ns,
+                           created_ns=ctime_ns, is_directory=False,
+                           attributes=attributes or None, device=device, inode=inode)
+
+    def large_file_indices(self, threshold_mb: int = 100) -> List[int]:
+        """Get indices of files larger than a size threshold.
+
+        Args:
+            threshold_mb: Size threshold in MB
+
+        Returns:
+            Indices into the result columns of files exceeding the threshold
+        """
+        threshold_bytes = threshold_mb * 1024 * 1024
+        if _np is not None and self.sizes:
+            sizes = _np.frombuffer(self.sizes, dtype=_np.int64)
+            return _np.flatnonzero(sizes > threshold_bytes).tolist()
+        return [i for i, size in enumerate(self.sizes) if size > threshold_bytes]
+
+    def stale_file_indices(self, age_days: int, now: Optional[float] = None) -> List[int]:
+        """Get indices of files not modified within the given number of days.
+
+        Args:
+            age_days: Minimum age in days since last modification
+            now: Reference POSIX timestamp (defaults to the current time)
+
+        Returns:
+            Indices into the result columns of files at least age_days old
+        """
+        cutoff_ns = int(((time.time() if now is None else now) - age_days * 86400.0) * 1e9)
+        if _np is not None and self.mtimes_ns:
+            mtimes_ns = _np.frombuffer(self.mtimes_ns, dtype=_np.int64)
+            return _np.flatnonzero(mtimes_ns <= cutoff_ns).tolist()
+        return [i for i, mtime_ns in enumerate(self.mtimes_ns) if mtime_ns <= cutoff_ns]
+
+
 class FileSystemScanner:
     """Scans file systems and collects file metadata."""
 
     def __init__(self):
         """Initialize the file system scanner."""
-        self._cancelled = False
+        # An Event rather than a bare flag, so worker threads observe
+        # cancellation through a synchronized check
+        self._cancel_event = threading.Event()
 
     def cancel(self) -> None:
         """Cancel ongoing scan operations."""
-        self._cancelled = True
+        self._cancel_event.set()
+
+    def collect(self, path: Path, config: Optional[ScanConfig] = None) -> ScanResult:
+        """Scan a directory tree into a columnar ScanResult.
+
+        Args:
+            path: Root path to scan
+            config: Scan configuration (uses defaults if None)
+
+        Returns:
+            ScanResult holding every file that passed the configured filters
+        """
+        config = config or ScanConfig()
+        result = ScanResult()
+        columns = (result.paths, result.sizes, result.mtimes_ns, result.ctimes_ns,
+                   result.attributes, result.devices, result.inodes)
+
+        # Rows go straight from stat() into the columns; no FileInfo is built.
+        # zip(*rows) transposes a directory's rows so each column is extended
+        # once per directory rather than appended to per file.
+        for rows in self._walk_directories(path, config, _stat_row):
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+        return result
+
+    def scan_batched(self, path: Path, config: Optional[ScanConfig] = None,
+                     batch_size: int = 512) -> Iterator[List[FileInfo]]:
+        """Scan a directory tree and yield the results in lists.
+
+        Batches are cut from the per-directory lists the walk produces, so
+        no generator is resumed per file and consumers that process results
+        in bulk pay one switch per batch.
+
+        Args:
+            path: Root path to scan
+            config: Scan configuration (uses defaults if None)
+            batch_size: Maximum number of FileInfo objects per batch
+
+        Returns:
+            Iterator over lists of up to batch_size FileInfo objects; only the
+            last may be shorter
+
+        Raises:
+            ValueError: If batch_size is less than 1, at call time rather than
+                on the first next()
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        return self._scan_batches(path, config or ScanConfig(), batch_size)
+
+    def _scan_batches(self, path: Path, config: ScanConfig,
+                      batch_size: int) -> Iterator[List[FileInfo]]:
+        """Generator behind scan_batched, run once its arguments are checked."""
+        batch = []
+        with closing(self._walk_directories(path, config)) as directories:
+            for files in directories:
+                batch.extend(files)
+                if len(batch) >= batch_size:
+                    full = len(batch) - len(batch) % batch_size
+                    for start in range(0, full, batch_size):
+                        yield batch[start:start + batch_size]
+                    batch = batch[full:]
+        if batch:
+            yield batch
 
     def _scan_directory(self, path: Path, max_depth: int, follow_symlinks: bool = False) -> Iterator[FileInfo]:
-        """Recursively scan a directory and yield FileInfo objects.
+        """Iteratively scan a directory tree and yield FileInfo objects.
+
+        Directories are walked with ``os.scandir`` from an explicit stack
+        rather than by recursion, so each entry's type and stat data come from
+        the cached ``DirEntry`` instead of separate ``Path`` syscalls.
 
         Args:
             path: Root path to scan
@@ -77,67 +436,289 @@ class FileSystemScanner:
             follow_symlinks: Whether to follow symbolic links
 
         Yields:
-            FileInfo objects for each file and directory found
+            FileInfo objects for each file found
+        """
+        return self._walk(path, ScanConfig(max_depth=max_depth, follow_symlinks=follow_symlinks))
+
+    def _walk(self, path: Path, config: ScanConfig,
+              make_entry: Callable[[str, str, os.stat_result], Any] = None
+              ) -> Iterator[Any]:
+        """Traverse a directory tree, skipping excluded entries before stat().
+
+        Flattens the per-directory lists of _walk_directories into one
+        stream of items. Closing this generator closes the walk, which shuts
+        down its thread pool.
+
+        Yields:
+            Items built for each file that is not excluded
+        """
+        # chain.from_iterable keeps per-item iteration in C; it does not
+        # forward close(), so the walk is closed explicitly
+        with closing(self._walk_directories(path, config, make_entry)) as directories:
+            yield from chain.from_iterable(directories)
+
+    def _walk_directories(self, path: Path, config: ScanConfig,
+                          make_entry: Callable[[str, str, os.stat_result], Any] = None
+                          ) -> Iterator[List[Any]]:
+        """Traverse a directory tree and yield the files of each directory as a list.
+
+        Directories are read into lists without a generator switch per
+        entry, so bulk consumers pay one resumption per directory. Every
+        filter precompiled by the ScanConfig is applied during the walk:
+        exclusions before an entry is classified, extensions before stat()
+        and the size limit before an item is built. Directories matching
+        the pruning patterns are never read. A root that is a file yields
+        that file alone.
+
+        Args:
+            path: Root path to scan
+            config: Scan configuration supplying depth, symlink handling,
+                thread count and the compiled filters
+            make_entry: Builds the yielded item from a file's directory path,
+                name and stat result (defaults to building a FileInfo)
+
+        Yields:
+            Lists of the items built for each directory's files; empty
+            directories and a negative max_depth produce no list
         """
-        if self._cancelled:
+        if config.max_depth < 0:
+            return
+        root = os.fspath(path)
+        try:
+            root_stat = os.stat(root, follow_symlinks=config.follow_symlinks)
+        except OSError:
             return
 
-        if max_depth < 0:
+        options = _WalkOptions(
+            root_prefix_len=len(os.path.join(root, '')),
+            filters=_config_filters(config),
+            fold_suffix_case=not config.case_sensitive_extensions,
+            make_entry=make_entry or _file_info_from_stat,
+            visited=None,
+            visited_lock=None
+        )
+        if not S_ISDIR(root_stat.st_mode):
+            # A file given as the root is reported itself; a symlink root is
+            # only entered when following links, like any other link
+            yield from _root_file_entries(root, root_stat, config, options)
             return
+        if config.follow_symlinks:
+            # Followed links can lead back into the tree; remember each
+            # directory's identity so every directory is read at most once
+            options.visited = {(root_stat.st_dev, root_stat.st_ino)}
+            options.visited_lock = threading.Lock()
+        # Delegating with yield from passes close() on to the walk
+        if config.max_threads > 1:
+            yield from self._walk_parallel(root, config, options)
+        else:
+            yield from self._walk_sequential(root, config, options)
+
+    def _walk_sequential(self, root: str, config: ScanConfig,
+                         options: '_WalkOptions') -> Iterator[List[Any]]:
+        """Walk the tree depth-first on the calling thread.
+
+        An explicit stack replaces recursion, so tree depth is bounded by
+        max_depth alone rather than the interpreter's recursion limit, and
+        pending work stays proportional to depth times fan-out.
+        """
+        cancelled = self._cancel_event.is_set
+        pending = [(root, config.max_depth)]
 
-        try:
-            # Check if it's a symlink and whether we should follow it
-            if path.is_symlink() and not follow_symlinks:
+        while pending:
+            if cancelled():
                 return
 
-            # Resolve symlinks if we're following them
-            resolved_path = path.resolve() if follow_symlinks and path.is_symlink() else path
-
-            # Get file metadata
-            try:
-                stat = resolved_path.stat()
-                hash_seed = f"{resolved_path.name}:{stat.st_size}:{stat.st_mtime}"
-
-                # Collect Windows file attributes if available
-                attributes = None
-                try:
-                    import ctypes
-                    # Get file attributes using Windows API
-                    attrs = ctypes.windll.kernel32.GetFileAttributesW(str(resolved_path))
-                    if attrs != -1:  # -1 indicates error
-                        attributes = attrs
-                except (AttributeError, OSError):
-                    # Not on Windows or API failed, attributes remain None
-                    pass
-
-                file_info = FileInfo(
-                    path=path,  # Keep original path, not resolved
-                    size_bytes=stat.st_size,
-                    modified_time=datetime.fromtimestamp(stat.st_mtime),
-                    created_time=datetime.fromtimestamp(stat.st_ctime),
-                    is_directory=resolved_path.is_dir(),
-                    attributes=attributes,  # Windows file attributes
-                    hash_seed=hash_seed  # For duplicate detection optimization
-                )
-                yield file_info
-            except (OSError, PermissionError):
-                # Skip files we can't access
+            dir_path, depth = pending.pop()
+            files = self._scan_entries(dir_path, depth, config, options, pending)
+            if files:
+                yield files
+
+    def _walk_parallel(self, root: str, config: ScanConfig,
+                       options: '_WalkOptions') -> Iterator[List[Any]]:
+        """Walk the tree with a pool of threads, one directory per task.
+
+        Directory reads and stat() calls release the GIL, so several workers
+        keep the disk busy while this generator hands results to the caller.
+        Subdirectories found by a worker are submitted back to the pool.
+
+        The pool is only started once more than PARALLEL_MIN_PENDING_DIRS
+        directories are waiting; until then the tree is read inline, so
+        shallow or narrow trees never pay for thread startup. At most
+        PARALLEL_TASKS_PER_WORKER tasks per thread are submitted at a time;
+        further directories wait on a stack, which keeps memory bounded by
+        how fast the caller consumes results.
+        """
+        cancelled = self._cancel_event.is_set
+        pending = [(root, config.max_depth)]
+        while pending and len(pending) <= PARALLEL_MIN_PENDING_DIRS:
+            if cancelled():
                 return
+            dir_path, depth = pending.pop()
+            files = self._scan_entries(dir_path, depth, config, options, pending)
+            if files:
+                yield files
+        if not pending:
+            return
+
+        max_in_flight = config.max_threads * PARALLEL_TASKS_PER_WORKER
+        executor = ThreadPoolExecutor(max_workers=config.max_threads)
+        futures = set()
+        try:
+            while (futures or pending) and not cancelled():
+                while pending and len(futures) < max_in_flight:
+                    dir_path, depth = pending.pop()
+                    futures.add(executor.submit(self._read_directory, dir_path, depth,
+                                               config, options))
+
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Checked per finished task, since cancel() may come
+                    # while a batch of them is being handed out
+                    if cancelled():
+                        return
+                    files, subdirs = future.result()
+                    pending.extend(subdirs)
+                    if files:
+                        yield files
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _read_directory(self, dir_path: str, depth: int, config: ScanConfig,
+                        options: '_WalkOptions') -> Tuple[List[Any], List[Tuple[str, int]]]:
+        """Read one directory completely, for use as a thread pool task.
 
-            # If it's a directory, recurse into it
-            if resolved_path.is_dir():
-                try:
-                    for child in resolved_path.iterdir():
-                        if self._cancelled:
-                            return
-                        yield from self._scan_directory(child, max_depth - 1, follow_symlinks)
-                except (OSError, PermissionError):
-                    # Skip directories we can't access
-                    pass
-
-        except (OSError, PermissionError):
-            # Skip paths we can't access
+        Returns:
+            Tuple of the directory's files and its subdirectories to visit
+        """
+        subdirs = []
+        files = self._scan_entries(dir_path, depth, config, options, subdirs)
+        return files, subdirs
+
+    def _scan_entries(self, dir_path: str, depth: int, config: ScanConfig,
+                      options: '_WalkOptions', subdirs) -> List[Any]:
+        """Scan the entries of a single directory.
+
+        Args:
+            dir_path: Directory to read
+            depth: Remaining depth below this directory
+            config: Scan configuration supplying symlink handling and the size limit
+            options: State shared by every directory read of the walk,
+                including its compiled filters
+            subdirs: List-like that receives (path, depth) of subdirectories
+                still within the depth limit
+
+        Returns:
+            Items built by options.make_entry for each file in the directory;
+            partial if the scan is cancelled while reading it
+        """
+        normcase = os.path.normcase
+        dir_prefix = os.path.join(dir_path, '')
+        splitext = os.path.splitext
+        # Hoisted into locals, which the per-entry loop reads fastest
+        follow_symlinks = config.follow_symlinks
+        filters = options.filters
+        exclude_re = filters.exclude_re
+        exclude_literals = filters.literals
+        exclude_endings = filters.endings
+        exclude_prefixes = filters.prefixes
+        check_exclusions = (exclude_re is not None or bool(exclude_literals)
+                            or bool(exclude_endings) or bool(exclude_prefixes))
+        prune_re = filters.prune_re
+        visited = options.visited
+        sep = os.sep
+        root_prefix_len = options.root_prefix_len
+        exclude_suffixes = filters.suffixes
+        fold_suffix_case = options.fold_suffix_case
+        min_size_bytes = config.min_file_size_bytes
+        make_entry = options.make_entry
+        cancelled = self._cancel_event.is_set
+        files = []
+        append = files.append
+        try:
+            with _scandir(dir_path) as entries:
+                for index, entry in enumerate(entries):
+                    # Polled every 64 entries: often enough to stop large
+                    # flat directories promptly, cheap enough to not matter
+                    if not index & 63 and cancelled():
+                        break
+
+                    if check_exclusions:
+                        entry_path = normcase(dir_prefix + entry.name)
+                        relative_path = entry_path[root_prefix_len:]
+                        if relative_path in exclude_literals or entry_path in exclude_literals:
+                            continue
+                        if exclude_endings and entry_path.endswith(exclude_endings):
+                            continue
+                        if exclude_prefixes and (entry_path.startswith(exclude_prefixes)
+                                                 or relative_path.startswith(exclude_prefixes)):
+                            continue
+                        if exclude_re is not None and (exclude_re.match(entry_path)
+                                                       or exclude_re.match(relative_path)):
+                            continue
+
+                    try:
+                        # Entry type comes from the dirent, so directories are
+                        # sorted out before any stat() call. Without
+                        # follow_symlinks, is_dir() and is_file() are False
+                        # for links, which skips them without another check
+                        if entry.is_dir(follow_symlinks=follow_symlinks):
+                            if depth > 0:
+                                sub_path = dir_prefix + entry.name
+                                if prune_re is not None:
+                                    dir_key = normcase(sub_path) + sep
+                                    if (prune_re.match(dir_key)
+                                            or prune_re.match(dir_key[root_prefix_len:])):
+                                        continue
+                                if (visited is not None
+                                        and not self._first_visit(entry, sub_path, options)):
+                                    continue
+                                subdirs.append((sub_path, depth - 1))
+                            continue
+                        # FIFOs, sockets and device nodes are not cleanup
+                        # candidates; stat() on some of them can also block
+                        if not entry.is_file(follow_symlinks=follow_symlinks):
+                            continue
+                        if exclude_suffixes:
+                            suffix = splitext(entry.name)[1]
+                            if (suffix.lower() if fold_suffix_case else suffix) in exclude_suffixes:
+                                continue
+                        stat = entry.stat(follow_symlinks=follow_symlinks)
+                    except OSError:
+                        # Skip entries we can't access (PermissionError and
+                        # FileNotFoundError are OSError subclasses)
+                        continue
+
+                    if stat.st_size < min_size_bytes:
+                        continue
+
+                    append(make_entry(dir_path, entry.name, stat))
+        except OSError:
+            # Skip directories we can't access
             pass
+        return files
+
+    @staticmethod
+    def _first_visit(entry: os.DirEntry, path: str, options: '_WalkOptions') -> bool:
+        """Record a directory reached while following symlinks.
+
+        Directories are identified by (st_dev, st_ino), so a symlink loop or
+        a second link to the same directory is detected in constant time.
+
+        Returns:
+            True if the directory has not been seen before in this walk
+        """
+        stat = entry.stat()
+        if not stat.st_ino:
+            # Windows scandir data carries no file index; ask for it
+            stat = os.stat(path)
+        key = (stat.st_dev, stat.st_ino)
+        with options.visited_lock:
+            if key in options.visited:
+                return False
+            options.visited.add(key)
+            return True
 
     def _scan_directory_with_config(self, path: Path, config: ScanConfig) -> Iterator[FileInfo]:
         """Scan directory applying exclusion rules from configuration.
@@ -146,41 +727,99 @@ class FileSystemScanner:
             path: Root path to scan
             config: Scan configuration with exclusion rules
 
-        Yields:
-            FileInfo objects for files that pass all exclusion filters
-        """
-        import fnmatch
-
-        for file_info in self._scan_directory(path, config.max_depth, config.follow_symlinks):
-            # Apply size-based filtering
-            if file_info.size_bytes < config.min_file_size_bytes:
-                continue
-
-            # Apply extension-based filtering
-            if config.exclude_extensions:
-                file_extension = file_info.path.suffix.lower()
-                if file_extension in [ext.lower() for ext in config.exclude_extensions]:
-                    continue
-
-            # Apply pattern-based filtering
-            if config.exclude_patterns:
-                should_exclude = False
-                for pattern in config.exclude_patterns:
-                    # Check if pattern matches file path
-                    if fnmatch.fnmatch(str(file_info.path), pattern):
-                        should_exclude = True
-                        break
-                    # Check if pattern matches relative path from scan root
-                    try:
-                        relative_path = file_info.path.relative_to(path)
-                        if fnmatch.fnmatch(str(relative_path), pattern):
-                            should_exclude = True
-                            break
-                    except ValueError:
-                        # Path is not relative to scan root, skip this check
-                        pass
-
-                if should_exclude:
-                    continue
-
-            yield file_info
+        Returns:
+            Iterator of FileInfo objects for files that pass all exclusion filters
+        """
+        # All filters run inside the walk, before a FileInfo is built
+        return self._walk(path, config)
+
+
+@dataclass
+class _WalkOptions:
+    """State of a single walk, shared by every directory read.
+
+    Only values derived when the walk starts live here; plain settings are
+    read from the ScanConfig, which the walk passes along.
+    """
+
+    __slots__ = ('root_prefix_len', 'filters', 'fold_suffix_case', 'make_entry', 'visited',
+                 'visited_lock')
+
+    root_prefix_len: int
+    filters: _CompiledFilters  # Compiled from the config when the walk starts
+    fold_suffix_case: bool
+    make_entry: Callable[[str, str, os.stat_result], Any]
+    visited: Optional[set]  # (st_dev, st_ino) of directories read, when following symlinks
+    visited_lock: Optional[threading.Lock]
+
+
+@contextmanager
+def _scandir(dir_path: str) -> Iterator[Iterator[os.DirEntry]]:
+    """Open a directory for scanning, through a descriptor where supported.
+
+    Entries of a descriptor scan carry only their name in DirEntry.path;
+    callers build full paths from dir_path.
+    """
+    if not _SCANDIR_BY_FD:
+        with os.scandir(dir_path) as entries:
+            yield entries
+        return
+    # scandir() leaves a passed descriptor open, so it is closed here
+    dir_fd = os.open(dir_path, _DIR_OPEN_FLAGS)
+    try:
+        with os.scandir(dir_fd) as entries:
+            yield entries
+    finally:
+        os.close(dir_fd)
+
+
+def _root_file_entries(root: str, root_stat: os.stat_result, config: ScanConfig,
+                       options: _WalkOptions) -> List[List[Any]]:
+    """Build the walk result for a root that is not a directory.
+
+    The root is checked like a file found in a walk: only regular files
+    pass, subject to the extension and size limits. As with a directory
+    root, exclusion patterns are not matched against the root itself.
+
+    Returns:
+        A single one-item list for a file that passes, otherwise no list
+    """
+    if not S_ISREG(root_stat.st_mode):
+        return []
+    dir_path, name = os.path.split(root)
+    exclude_suffixes = options.filters.suffixes
+    if exclude_suffixes:
+        suffix = os.path.splitext(name)[1]
+        if options.fold_suffix_case:
+            suffix = suffix.lower()
+        if suffix in exclude_suffixes:
+            return []
+    if root_stat.st_size < config.min_file_size_bytes:
+        return []
+    return [[options.make_entry(dir_path, name, root_stat)]]
+
+
+def _file_info_from_stat(dir_path: str, name: str,
+                         stat: os.stat_result) -> FileInfo:
+    """Build a FileInfo for a regular file from its stat result."""
+    return FileInfo(
+        # Keeping the shared directory string and the name, rather than
+        # the joined path, stores each directory prefix once per directory
+        parent=dir_path,
+        name=name,
+        size_bytes=stat.st_size,
+        modified_ns=stat.st_mtime_ns,
+        created_ns=stat.st_ctime_ns,
+        is_directory=False,
+        # On Windows scandir already returns dwFileAttributes
+        attributes=getattr(stat, 'st_file_attributes', None),
+        device=stat.st_dev,
+        inode=stat.st_ino
+    )
+
+
+def _stat_row(dir_path: str, name: str,
+              stat: os.stat_result) -> Tuple[str, int, int, int, int, int, int]:
+    """Reduce a stat result to one row of ScanResult columns without a FileInfo."""
+    return (os.path.join(dir_path, name), stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns,
+            getattr(stat, 'st_file_attributes', 0), stat.st_dev, stat.st_ino)
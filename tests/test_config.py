@@ -266,6 +266,7 @@ performance:
             json.dump(config_dict, f)
             temp_path = Path(f.name)
 
+        try:
             config_data = config_manager._read_config_file(temp_path)
             assert isinstance(config_data, dict)
             assert config_data == config_dict
@@ -467,3 +468,161 @@ performance:
 
             # File should not exist
             assert not invalid_path.exists()
+
+    @pytest.mark.unit
+    def test_configuration_file_cache(self):
+        """Test that parsed configuration files are cached until they change."""
+        from disk_cleaner.src.disk_cleaner.config import ConfigurationManager
+        import tempfile
+        import time
+        from pathlib import Path
+        import os
+
+        config_manager = ConfigurationManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text("scan:\n  max_depth: 5\n")
+            old_ns = time.time_ns() - 10_000_000_000
+            os.utime(config_path, ns=(old_ns, old_ns))
+
+            first = config_manager._read_config_file(config_path)
+            assert first['scan']['max_depth'] == 5
+            assert config_path in config_manager._file_cache
+
+            # Callers get their own copy, so mutating it cannot poison the cache
+            first['scan']['max_depth'] = 99
+            assert config_manager._read_config_file(config_path)['scan']['max_depth'] == 5
+
+            # A changed file is re-parsed
+            config_path.write_text("scan:\n  max_depth: 7\n")
+            assert config_manager._read_config_file(config_path)['scan']['max_depth'] == 7
+
+    @pytest.mark.unit
+    def test_configuration_file_cache_distrusts_recent_mtime(self):
+        """Test that a same-size rewrite within one timestamp tick is not served from cache."""
+        from disk_cleaner.src.disk_cleaner.config import ConfigurationManager
+        import tempfile
+        from pathlib import Path
+        import os
+
+        config_manager = ConfigurationManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text("scan:\n  max_depth: 5\n")
+            before = config_path.stat()
+            assert config_manager._read_config_file(config_path)['scan']['max_depth'] == 5
+
+            # Same size, and on a coarse filesystem the same mtime
+            config_path.write_text("scan:\n  max_depth: 7\n")
+            os.utime(config_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+            assert config_path.stat().st_size == before.st_size
+
+            assert config_manager._read_config_file(config_path)['scan']['max_depth'] == 7
+            assert config_path not in config_manager._file_cache
+
+    @pytest.mark.unit
+    def test_configuration_discovery_tracks_directory_changes(self):
+        """Test that cached discovery notices config files added to a search location."""
+        from disk_cleaner.src.disk_cleaner.config import ConfigurationManager
+        import tempfile
+        from pathlib import Path
+        import os
+
+        config_manager = ConfigurationManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                config_path = Path.cwd() / "config.yaml"
+                assert config_path not in config_manager._discover_config_files()
+
+                config_path.write_text("scan: {}")
+
+                assert config_path in config_manager._discover_config_files()
+                assert config_path in config_manager._discover_config_files()
+            finally:
+                os.chdir(original_cwd)
+
+    @pytest.mark.unit
+    def test_configuration_discovery_distrusts_recent_directory_mtime(self):
+        """Test that a file created within the directory's timestamp tick is still discovered."""
+        from disk_cleaner.src.disk_cleaner.config import ConfigurationManager
+        import tempfile
+        import time
+        from pathlib import Path
+        import os
+
+        config_manager = ConfigurationManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                location = os.fspath(Path.cwd())
+                config_path = Path.cwd() / "config.yaml"
+                before = Path.cwd().stat()
+                assert config_path not in config_manager._discover_config_files()
+
+                # On a coarse filesystem the creation lands in the same tick
+                # and leaves the directory mtime as it was
+                config_path.write_text("scan: {}")
+                os.utime(location, ns=(before.st_atime_ns, before.st_mtime_ns))
+                assert config_path in config_manager._discover_config_files()
+                assert location not in config_manager._discovery_cache
+
+                # Once the mtime is old enough it is cached as a signature
+                old_ns = time.time_ns() - 10_000_000_000
+                os.utime(location, ns=(old_ns, old_ns))
+                assert config_path in config_manager._discover_config_files()
+                assert config_manager._discovery_cache[location] == (old_ns, [config_path])
+            finally:
+                os.chdir(original_cwd)
+
+    @pytest.mark.unit
+    def test_default_configuration_is_independent_per_call(self):
+        """Test that each default configuration can be modified without affecting others."""
+        from disk_cleaner.src.disk_cleaner.config import DefaultConfigurationSource
+
+        source = DefaultConfigurationSource()
+        first = source.load()
+        second = source.load()
+
+        assert first == second
+        first['scan']['paths'].append('extra')
+        first['performance']['max_threads'] = 1
+        first['classification']['exclude_extensions'].append('.log')
+        assert 'extra' not in second['scan']['paths']
+        assert isinstance(second['scan']['exclude_patterns'], list)
+        assert source.load() == second
+
+    @pytest.mark.unit
+    def test_configuration_backup_pruning(self):
+        """Test that only the newest backups are kept when saving configuration."""
+        from disk_cleaner.src.disk_cleaner.config import ConfigurationManager, MAX_CONFIG_BACKUPS
+        import tempfile
+        from pathlib import Path
+
+        config_manager = ConfigurationManager()
+        config = config_manager.get_default_configuration()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text("initial: content")
+
+            # Simulate backups left by earlier saves
+            for timestamp in range(1, MAX_CONFIG_BACKUPS + 3):
+                (Path(temp_dir) / f"config.backup.{timestamp}.yaml").write_text(f"old: {timestamp}")
+
+            result = config_manager.save_configuration(config, config_path)
+            assert result is True
+
+            backup_files = list(config_path.parent.glob("config.backup.*.yaml"))
+            assert len(backup_files) == MAX_CONFIG_BACKUPS
+            assert not (Path(temp_dir) / "config.backup.1.yaml").exists()
+
+            # The backup taken by this save still holds the original content
+            newest = max(backup_files, key=lambda p: int(p.name.split('.')[2]))
+            assert newest.read_text() == "initial: content"
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from typing import List
+from datetime import datetime
 
 
 class TestFileSystemScanner:
@@ -68,6 +69,26 @@ class TestFileSystemScanner:
             assert len(level1_files) > 0
             assert len(level2_files) == 0  # Should be limited by max_depth
 
+    @pytest.mark.unit
+    def test_negative_max_depth_scans_nothing(self):
+        """Test that a negative max_depth yields nothing, even for the root's own files."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "top.txt").write_text("content")
+            (temp_path / "sub").mkdir()
+            (temp_path / "sub" / "nested.txt").write_text("content")
+
+            assert [f.path.name for f in scanner._scan_directory(temp_path, max_depth=0)] == ["top.txt"]
+            assert list(scanner._scan_directory(temp_path, max_depth=-1)) == []
+            assert list(scanner._scan_directory(temp_path / "top.txt", max_depth=-1)) == []
+            assert len(scanner.collect(temp_path, ScanConfig(max_depth=-1))) == 0
+
     @pytest.mark.unit
     def test_permission_error_handling(self):
         """Test graceful handling of permission denied errors."""
@@ -577,3 +598,891 @@ class TestFileSystemScanner:
 
             # Verify performance is reasonable
             assert (end_time - start_time) < 2.0  # Should complete in less than 2 seconds
+
+    @pytest.mark.unit
+    def test_timestamps_stored_as_raw_values(self):
+        """Test that timestamps are kept raw and converted to datetime on access."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            test_file = temp_path / "fresh.txt"
+            test_file.write_text("fresh")
+
+            files = list(scanner._scan_directory(temp_path, max_depth=5))
+            file_info = files[0]
+
+            # Raw POSIX timestamps are stored, datetimes are derived from them
+            assert file_info.modified_ns == test_file.stat().st_mtime_ns
+            assert isinstance(file_info.modified_ns, int)
+            assert file_info.modified_ts == pytest.approx(test_file.stat().st_mtime)
+            assert file_info.modified_time == datetime.fromtimestamp(file_info.modified_ts)
+            assert file_info.created_time == datetime.fromtimestamp(file_info.created_ts)
+            assert file_info.get_age_days() == 0
+            assert file_info.get_age_days(now=file_info.modified_ts + 3.5 * 86400) == 3
+
+    @pytest.mark.unit
+    def test_file_info_uses_slots(self):
+        """Test that FileInfo instances carry no per-instance __dict__."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "file.txt").write_text("content")
+
+            file_info = next(scanner._scan_directory(temp_path, max_depth=5))
+
+            assert not hasattr(file_info, '__dict__')
+            with pytest.raises(AttributeError):
+                file_info.unexpected_attribute = True
+
+    @pytest.mark.unit
+    def test_path_object_built_lazily(self):
+        """Test that FileInfo keeps the raw path string and builds Path on demand."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "file.txt").write_text("content")
+
+            file_info = next(scanner._scan_directory(temp_path, max_depth=5))
+
+            assert file_info.path_str == str(temp_path / "file.txt")
+            assert file_info.path == temp_path / "file.txt"
+            assert file_info.path is file_info.path
+
+    @pytest.mark.unit
+    def test_excluded_directories_are_pruned(self):
+        """Test that a directory matching an exclusion pattern is not descended into."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            (temp_path / "keep.txt").write_text("keep")
+            modules_dir = temp_path / "project" / "node_modules"
+            modules_dir.mkdir(parents=True)
+            (modules_dir / "package.json").write_text("{}")
+
+            config = ScanConfig(
+                max_depth=5,
+                exclude_patterns=["**/node_modules"]
+            )
+
+            files = list(scanner._scan_directory_with_config(temp_path, config))
+
+            file_names = [f.path.name for f in files]
+            assert "keep.txt" in file_names
+            assert "package.json" not in file_names
+
+    @pytest.mark.unit
+    def test_parallel_traversal(self):
+        """Test that a multi-threaded scan finds the same files as a sequential one."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            # Create a tree with several directories for workers to share
+            for i in range(5):
+                subdir = temp_path / f"dir{i}"
+                (subdir / "nested").mkdir(parents=True)
+                (subdir / f"file{i}.txt").write_text(f"content{i}")
+                (subdir / "nested" / f"deep{i}.txt").write_text(f"deep{i}")
+                (subdir / f"skip{i}.tmp").write_text("skip")
+
+            sequential = ScanConfig(max_depth=5, exclude_patterns=["*.tmp"])
+            parallel = ScanConfig(max_depth=5, exclude_patterns=["*.tmp"], max_threads=4)
+
+            sequential_paths = {f.path for f in scanner._scan_directory_with_config(temp_path, sequential)}
+            parallel_paths = {f.path for f in scanner._scan_directory_with_config(temp_path, parallel)}
+
+            assert len(parallel_paths) == 10
+            assert parallel_paths == sequential_paths
+
+    @pytest.mark.unit
+    def test_batched_scanning(self):
+        """Test that scan results can be consumed in fixed-size batches."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            for i in range(25):
+                (temp_path / f"file{i}.txt").write_text(f"content{i}")
+
+            batches = list(scanner.scan_batched(temp_path, ScanConfig(max_depth=5), batch_size=10))
+
+            assert [len(batch) for batch in batches] == [10, 10, 5]
+            assert len({f.path for batch in batches for f in batch}) == 25
+
+            with pytest.raises(ValueError):
+                scanner.scan_batched(temp_path, batch_size=0)
+
+    @pytest.mark.unit
+    def test_columnar_scan_result(self):
+        """Test collecting scan results into columns for bulk size and age queries."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+        import os
+        import time
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            small_file = temp_path / "small.txt"
+            small_file.write_text("small")
+            large_file = temp_path / "large.bin"
+            large_file.write_bytes(b"x" * (2 * 1024 * 1024))
+            old_file = temp_path / "old.txt"
+            old_file.write_text("old")
+            old_time = time.time() - 60 * 86400
+            os.utime(old_file, (old_time, old_time))
+
+            result = scanner.collect(temp_path, ScanConfig(max_depth=5))
+
+            assert len(result) == 3
+            assert len(result.sizes) == len(result.mtimes_ns) == 3
+
+            large = [result.paths[i] for i in result.large_file_indices(threshold_mb=1)]
+            assert large == [str(large_file)]
+
+            stale = [result.paths[i] for i in result.stale_file_indices(age_days=30)]
+            assert stale == [str(old_file)]
+
+    @pytest.mark.unit
+    def test_scan_result_queries_agree_with_numpy(self, monkeypatch):
+        """Test that the vectorized and pure-Python column queries return the same indices."""
+        pytest.importorskip("numpy")
+        from disk_cleaner.src.disk_cleaner import file_scanner
+        from disk_cleaner.src.disk_cleaner.file_scanner import ScanResult
+        from array import array
+
+        now = 1_700_000_000.0
+        day_ns = 86400 * 10**9
+        mib = 1024 * 1024
+        result = ScanResult(
+            paths=[f"file{i}" for i in range(6)],
+            sizes=array('q', [0, 5 * mib, 1 * mib, 1 * mib + 1, 300 * mib, 10]),
+            mtimes_ns=array('q', [int(now * 1e9) - d * day_ns for d in (0, 31, 30, 29, 400, 1)])
+        )
+
+        vectorized = (result.large_file_indices(threshold_mb=1), result.stale_file_indices(30, now=now))
+        empty = (ScanResult().large_file_indices(), ScanResult().stale_file_indices(30))
+        monkeypatch.setattr(file_scanner, "_np", None)
+
+        assert vectorized == ([1, 3, 4], [1, 2, 4])
+        assert vectorized == (result.large_file_indices(threshold_mb=1),
+                              result.stale_file_indices(30, now=now))
+        assert empty == ([], [])
+
+    @pytest.mark.unit
+    def test_file_symlinks_skipped_without_follow(self):
+        """Test that symlinks to files, including dangling ones, are skipped unless followed."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            target = temp_path / "target.txt"
+            target.write_text("target")
+            try:
+                (temp_path / "file_link.txt").symlink_to(target)
+                (temp_path / "dangling.txt").symlink_to(temp_path / "missing.txt")
+            except OSError:
+                pytest.skip("Symlinks not supported on this platform")
+
+            names = [f.path.name for f in scanner._scan_directory(temp_path, max_depth=5)]
+            assert names == ["target.txt"]
+
+            followed = [f.path.name for f in scanner._scan_directory(temp_path, max_depth=5, follow_symlinks=True)]
+            assert sorted(followed) == ["file_link.txt", "target.txt"]
+
+    @pytest.mark.unit
+    def test_non_directory_roots(self):
+        """Test that a file root yields itself and a symlink root is entered only when followed."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            target_dir = temp_path / "target"
+            target_dir.mkdir()
+            file_path = target_dir / "file.txt"
+            file_path.write_text("content")
+
+            files = list(scanner._scan_directory(file_path, max_depth=5))
+            assert [f.path for f in files] == [file_path]
+            assert files[0].size_bytes == len("content")
+            assert list(scanner._scan_directory(temp_path / "missing", max_depth=5)) == []
+
+            config = ScanConfig(exclude_extensions=[".txt"])
+            assert list(scanner._scan_directory_with_config(file_path, config)) == []
+            assert len(scanner.collect(file_path)) == 1
+
+            try:
+                (temp_path / "dir_link").symlink_to(target_dir, target_is_directory=True)
+                (temp_path / "file_link.txt").symlink_to(file_path)
+            except OSError:
+                pytest.skip("Symlinks not supported on this platform")
+
+            for link_name, expected in (("dir_link", ["file.txt"]), ("file_link.txt", ["file_link.txt"])):
+                link = temp_path / link_name
+                assert list(scanner._scan_directory(link, max_depth=5)) == []
+                followed = list(scanner._scan_directory(link, max_depth=5, follow_symlinks=True))
+                assert [f.path.name for f in followed] == expected
+
+    @pytest.mark.unit
+    def test_extension_filter_applies_to_files_only(self):
+        """Test that extensions are matched case-insensitively and never prune directories."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "UPPER.TMP").write_text("content")
+            (temp_path / "keep.txt").write_text("content")
+            (temp_path / "cache.tmp").mkdir()
+            (temp_path / "cache.tmp" / "inner.txt").write_text("content")
+
+            config = ScanConfig(exclude_extensions=[".tmp"])
+            file_names = [f.path.name for f in scanner._scan_directory_with_config(temp_path, config)]
+
+            assert sorted(file_names) == ["inner.txt", "keep.txt"]
+
+    @pytest.mark.unit
+    def test_datetime_conversions_cached(self):
+        """Test that datetime views of the timestamps are computed once per FileInfo."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "file.txt").write_text("content")
+
+            file_info = next(scanner._scan_directory(temp_path, max_depth=5))
+
+            assert file_info.modified_time is file_info.modified_time
+            assert file_info.created_time is file_info.created_time
+            assert file_info.modified_time == datetime.fromtimestamp(file_info.modified_ts)
+
+    @pytest.mark.unit
+    def test_collect_matches_file_info_scan(self):
+        """Test that collect() fills every column consistently with the FileInfo scan."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(3):
+                subdir = temp_path / f"dir{i}"
+                subdir.mkdir()
+                (subdir / "data.bin").write_bytes(b"x" * (i + 1) * 10)
+                (subdir / "tiny.txt").write_text("x")
+
+            for max_threads in (1, 4):
+                config = ScanConfig(min_file_size_bytes=5, max_threads=max_threads)
+                expected = {
+                    f.path_str: f for f in scanner._scan_directory_with_config(temp_path, config)
+                }
+                result = scanner.collect(temp_path, config)
+
+                assert len(result) == len(result.ctimes_ns) == len(result.inodes) == 3
+                assert {f.path_str: f for f in result} == expected
+
+    @pytest.mark.unit
+    def test_parallel_scan_stops_after_cancel(self, monkeypatch):
+        """Test that cancelling a multi-threaded scan stops it before the tree is exhausted."""
+        from disk_cleaner.src.disk_cleaner import file_scanner
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        import time
+        from pathlib import Path
+
+        real_wait = file_scanner.wait
+
+        def slow_wait(*args, **kwargs):
+            # Let every submitted directory finish, so one wait() returns them all
+            time.sleep(0.2)
+            return real_wait(*args, **kwargs)
+
+        monkeypatch.setattr(file_scanner, "wait", slow_wait)
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(10):
+                subdir = temp_path / f"dir{i}"
+                subdir.mkdir()
+                for j in range(10):
+                    (subdir / f"file{j}.txt").write_text("content")
+
+            files = scanner._scan_directory_with_config(temp_path, ScanConfig(max_threads=4))
+            seen = [next(files)]
+            scanner.cancel()
+            seen.extend(files)
+
+            # The directory being delivered is finished, the others already
+            # read are dropped, as in a sequential scan
+            assert len(seen) == 10
+            assert len({f.parent for f in seen}) == 1
+
+    @pytest.mark.unit
+    def test_scan_streams_results(self):
+        """Test that a scan yields results before the tree is read and honours cancel mid-stream."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(10):
+                subdir = temp_path / f"dir{i}"
+                subdir.mkdir()
+                for j in range(10):
+                    (subdir / f"file{j}.txt").write_text("content")
+
+            files = scanner._scan_directory(temp_path, max_depth=5)
+            next(files)
+            scanner.cancel()
+            remaining = list(files)
+
+            # The rest of the directory already read is delivered; no
+            # further directory is opened after cancel()
+            assert len(remaining) == 9
+
+    @pytest.mark.unit
+    def test_closing_parallel_scan_stops_pool(self):
+        """Test that close() on a partly consumed parallel scan shuts its workers down."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        import threading
+        from pathlib import Path
+
+        def pool_threads():
+            return {t for t in threading.enumerate() if t.name.startswith("ThreadPoolExecutor")}
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(20):
+                subdir = temp_path / f"dir{i}"
+                subdir.mkdir()
+                for j in range(5):
+                    (subdir / f"file{j}.txt").write_text("content")
+
+            config = ScanConfig(max_threads=4)
+            before = pool_threads()
+            for scan in (scanner._scan_directory_with_config(temp_path, config),
+                         scanner.scan_batched(temp_path, config, batch_size=5)):
+                next(scan)
+                assert pool_threads() - before
+
+                scan.close()
+
+                assert not pool_threads() - before
+                assert list(scan) == []
+
+            # Unlike cancel(), closing a scan leaves the scanner usable
+            assert len(list(scanner._scan_directory_with_config(temp_path, config))) == 100
+
+    @pytest.mark.unit
+    def test_exclude_patterns_compiled_once(self):
+        """Test that configurations with the same filters share one compiled state."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import ScanConfig, _config_filters
+
+        first = ScanConfig(exclude_patterns=["*.tmp", "**/cache/**"], exclude_extensions=[".BAK"])
+        second = ScanConfig(exclude_patterns=["*.tmp", "**/cache/**"], exclude_extensions=[".BAK"])
+
+        assert _config_filters(first) is _config_filters(second)
+        assert _config_filters(first).suffixes == {".bak"}
+        assert _config_filters(ScanConfig()).exclude_re is None
+
+    @pytest.mark.unit
+    def test_config_changes_apply_to_next_scan(self):
+        """Test that filters edited after a ScanConfig is built are honoured by later scans."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for name in ("notes.txt", "trace.LOG", "keep.py"):
+                (temp_path / name).write_text("content")
+
+            def scanned_names(config):
+                return {f.path.name for f in scanner._scan_directory_with_config(temp_path, config)}
+
+            config = ScanConfig()
+            assert scanned_names(config) == {"notes.txt", "trace.LOG", "keep.py"}
+
+            config.exclude_patterns.append("*.txt")
+            assert scanned_names(config) == {"trace.LOG", "keep.py"}
+
+            config.exclude_extensions = ["log"]
+            assert scanned_names(config) == {"keep.py"}
+
+            config.case_sensitive_extensions = True
+            assert scanned_names(config) == {"trace.LOG", "keep.py"}
+
+    @pytest.mark.unit
+    def test_extension_filter_matches_final_suffix(self):
+        """Test that extension filtering compares the final suffix like Path.suffix."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for name in ("archive.tar.gz", "notes.GZ", ".gz", "data.gzip"):
+                (temp_path / name).write_text("content")
+
+            config = ScanConfig(exclude_extensions=[".GZ", ".bak"])
+            file_names = {f.path.name for f in scanner._scan_directory_with_config(temp_path, config)}
+
+            assert file_names == {".gz", "data.gzip"}
+
+    @pytest.mark.unit
+    def test_literal_exclude_patterns(self):
+        """Test that patterns without wildcards exclude exactly matching paths."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig, _config_filters
+        import tempfile
+        from pathlib import Path
+        import os
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "node_modules").mkdir()
+            (temp_path / "node_modules" / "pkg.js").write_text("content")
+            (temp_path / "src").mkdir()
+            (temp_path / "src" / "node_modules.txt").write_text("content")
+            (temp_path / "src" / "main.py").write_text("content")
+
+            config = ScanConfig(exclude_patterns=["node_modules", os.path.join("src", "main.py")])
+            file_names = {f.path.name for f in scanner._scan_directory_with_config(temp_path, config)}
+
+            assert _config_filters(config).exclude_re is None
+            assert file_names == {"node_modules.txt"}
+
+    @pytest.mark.unit
+    def test_duplicate_key(self):
+        """Test that the duplicate key exposes the metadata hashed into hash_seed."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "file.txt").write_text("content")
+
+            file_info = next(scanner._scan_directory(temp_path, max_depth=5))
+
+            assert file_info.duplicate_key == ("file.txt", 7, file_info.modified_ns)
+            assert file_info.hash_seed == hash(file_info.duplicate_key)
+
+    @pytest.mark.unit
+    def test_file_identity_recorded(self):
+        """Test that hard links to one file share the file_id recorded during the scan."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+        import os
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            original = temp_path / "original.txt"
+            original.write_text("content")
+            (temp_path / "other.txt").write_text("content")
+            try:
+                os.link(original, temp_path / "linked.txt")
+            except (OSError, AttributeError):
+                pytest.skip("Hard links not supported on this platform")
+
+            files = {f.path.name: f for f in scanner._scan_directory(temp_path, max_depth=5)}
+            if files["original.txt"].file_id is None:
+                pytest.skip("File identity not reported by scandir on this platform")
+
+            assert files["original.txt"].file_id == files["linked.txt"].file_id
+            assert files["original.txt"].file_id != files["other.txt"].file_id
+
+    @pytest.mark.unit
+    def test_entries_share_parent_string(self):
+        """Test that files from one directory share a single parent path string."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "a.txt").write_text("content")
+            (temp_path / "b.txt").write_text("content")
+
+            first, second = scanner._scan_directory(temp_path, max_depth=5)
+
+            assert first.parent is second.parent
+            assert {first.name, second.name} == {"a.txt", "b.txt"}
+            assert first.path_str == str(temp_path / first.name)
+
+    @pytest.mark.unit
+    def test_batches_span_directories(self):
+        """Test that fixed-size batches are cut across directory boundaries."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(3):
+                subdir = temp_path / f"dir{i}"
+                subdir.mkdir()
+                for j in range(7):
+                    (subdir / f"file{j}.txt").write_text("content")
+
+            batches = list(scanner.scan_batched(temp_path, ScanConfig(), batch_size=5))
+
+            assert [len(batch) for batch in batches] == [5, 5, 5, 5, 1]
+            assert len({f.path_str for batch in batches for f in batch}) == 21
+
+    @pytest.mark.unit
+    def test_special_files_skipped(self):
+        """Test that FIFOs and other non-regular files are not reported."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import tempfile
+        from pathlib import Path
+        import os
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "regular.txt").write_text("content")
+            try:
+                os.mkfifo(temp_path / "pipe")
+            except (OSError, AttributeError):
+                pytest.skip("FIFOs not supported on this platform")
+
+            file_names = [f.path.name for f in scanner._scan_directory(temp_path, max_depth=5)]
+
+            assert file_names == ["regular.txt"]
+
+    @pytest.mark.unit
+    def test_parallel_scan_of_wide_tree(self):
+        """Test that a tree wider than the in-flight task limit is scanned completely."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import (
+            FileSystemScanner, ScanConfig, PARALLEL_TASKS_PER_WORKER
+        )
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            dir_count = 2 * PARALLEL_TASKS_PER_WORKER * 3
+            for i in range(dir_count):
+                subdir = temp_path / f"dir{i}" / "nested"
+                subdir.mkdir(parents=True)
+                (subdir / "file.txt").write_text("content")
+
+            config = ScanConfig(max_threads=2)
+            paths = [f.path_str for f in scanner._scan_directory_with_config(temp_path, config)]
+
+            assert len(paths) == len(set(paths)) == dir_count
+
+    @pytest.mark.unit
+    def test_parallel_scan_bounds_tasks_in_flight(self):
+        """Test that a paused consumer holds at most max_threads * PARALLEL_TASKS_PER_WORKER reads."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import (
+            FileSystemScanner, ScanConfig, PARALLEL_TASKS_PER_WORKER
+        )
+        import tempfile
+        import threading
+        import time
+        from pathlib import Path
+
+        class CountingScanner(FileSystemScanner):
+            def __init__(self):
+                super().__init__()
+                self.lock = threading.Lock()
+                self.started = 0
+                self.active = 0
+                self.max_active = 0
+
+            def _read_directory(self, *args):
+                with self.lock:
+                    self.started += 1
+                    self.active += 1
+                    self.max_active = max(self.max_active, self.active)
+                try:
+                    return super()._read_directory(*args)
+                finally:
+                    with self.lock:
+                        self.active -= 1
+
+        scanner = CountingScanner()
+        max_threads = 2
+        bound = max_threads * PARALLEL_TASKS_PER_WORKER
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            dir_count = bound * 6
+            for i in range(dir_count):
+                subdir = temp_path / f"dir{i}"
+                subdir.mkdir()
+                (subdir / "file.txt").write_text("content")
+
+            files = scanner._scan_directory_with_config(temp_path, ScanConfig(max_threads=max_threads))
+            seen = [next(files)]
+
+            # While the consumer holds the generator no further reads are
+            # submitted, however long the workers have been idle
+            time.sleep(0.1)
+            assert scanner.started <= bound
+
+            seen.extend(files)
+
+            assert len(seen) == dir_count
+            assert scanner.started == dir_count
+            assert scanner.max_active <= max_threads
+
+    @pytest.mark.unit
+    def test_subtree_patterns_prune_directories(self, monkeypatch):
+        """Test that patterns covering a whole subtree stop the walk at that directory."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import os
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+        real_scandir = os.scandir
+        listed = []
+
+        class RecordingScandir:
+            """Listing that records the name of every entry it hands out."""
+
+            def __init__(self, path):
+                self._entries = real_scandir(path)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                self._entries.close()
+
+            def __iter__(self):
+                for entry in self._entries:
+                    listed.append(entry.name)
+                    yield entry
+
+        monkeypatch.setattr(os, "scandir", RecordingScandir)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "cache" / "inner").mkdir(parents=True)
+            (temp_path / "cache" / "inner" / "blob.bin").write_text("content")
+            (temp_path / "src" / "cache").mkdir(parents=True)
+            (temp_path / "src" / "cache" / "nested.txt").write_text("content")
+            (temp_path / "src" / "main.py").write_text("content")
+
+            config = ScanConfig(exclude_patterns=["cache/**", "**/cache/**"])
+            file_names = [f.path.name for f in scanner._scan_directory_with_config(temp_path, config)]
+
+            assert file_names == ["main.py"]
+            # Contents of a pruned directory are never listed
+            assert "inner" not in listed
+            assert "blob.bin" not in listed
+            assert "nested.txt" not in listed
+
+    @pytest.mark.unit
+    def test_attribute_flags(self):
+        """Test that hidden and system flags are decoded from the attribute bits."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileInfo
+        import stat
+
+        def make(attributes):
+            return FileInfo(parent="root", name="file.txt", size_bytes=0, modified_ns=0,
+                            created_ns=0, is_directory=False, attributes=attributes,
+                            device=0, inode=0)
+
+        hidden = make(stat.FILE_ATTRIBUTE_HIDDEN | stat.FILE_ATTRIBUTE_ARCHIVE)
+        system = make(stat.FILE_ATTRIBUTE_SYSTEM)
+
+        assert hidden.is_hidden and not hidden.is_system
+        assert system.is_system and not system.is_hidden
+        assert not make(None).is_hidden
+        assert not make(None).is_system
+
+    @pytest.mark.unit
+    def test_symlink_loop_visited_once(self):
+        """Test that a symlink pointing back up the tree does not repeat directories."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "top.txt").write_text("content")
+            (temp_path / "sub").mkdir()
+            (temp_path / "sub" / "inner.txt").write_text("content")
+            try:
+                (temp_path / "sub" / "loop").symlink_to(temp_path, target_is_directory=True)
+            except OSError:
+                pytest.skip("Symlinks not supported on this platform")
+
+            for max_threads in (1, 4):
+                config = ScanConfig(max_depth=10, follow_symlinks=True, max_threads=max_threads)
+                names = [f.path.name for f in scanner._scan_directory_with_config(temp_path, config)]
+
+                assert sorted(names) == ["inner.txt", "top.txt"]
+
+    @pytest.mark.unit
+    def test_cancel_interrupts_large_directory(self, monkeypatch):
+        """Test that cancellation takes effect inside a single large directory."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner
+        import os
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+        real_scandir = os.scandir
+
+        class CancellingScandir:
+            """Listing that cancels the scan once its first entry is handed out."""
+
+            def __init__(self, path):
+                self._entries = real_scandir(path)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                self._entries.close()
+
+            def __iter__(self):
+                for entry in self._entries:
+                    yield entry
+                    scanner.cancel()
+
+        monkeypatch.setattr(os, "scandir", CancellingScandir)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for i in range(500):
+                (temp_path / f"file{i}.txt").write_text("content")
+
+            files = list(scanner._scan_directory(temp_path, max_depth=5))
+
+            assert 0 < len(files) <= 64
+
+    @pytest.mark.unit
+    def test_simple_globs_use_string_tests(self):
+        """Test that '*suffix' and 'prefix*' patterns bypass the regex but still match."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig, _config_filters
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "sub").mkdir()
+            (temp_path / "sub" / "skip.tmp").write_text("content")
+            (temp_path / "sub" / "keep.txt").write_text("content")
+            (temp_path / "build").mkdir()
+            (temp_path / "build" / "out.txt").write_text("content")
+            (temp_path / "builder.txt").write_text("content")
+
+            config = ScanConfig(exclude_patterns=["*.tmp", "build*"])
+            file_names = {f.path.name for f in scanner._scan_directory_with_config(temp_path, config)}
+
+            filters = _config_filters(config)
+            assert filters.exclude_re is None
+            assert filters.endings == (".tmp",)
+            assert filters.prefixes == ("build",)
+            assert file_names == {"keep.txt"}
+
+    @pytest.mark.unit
+    def test_extension_normalization_and_case_opt_out(self):
+        """Test that extensions work without a leading dot and can match case-sensitively."""
+        from disk_cleaner.src.disk_cleaner.file_scanner import FileSystemScanner, ScanConfig, _config_filters
+        import tempfile
+        from pathlib import Path
+
+        scanner = FileSystemScanner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for name in ("lower.log", "UPPER.LOG", "keep.txt"):
+                (temp_path / name).write_text("content")
+
+            folded = ScanConfig(exclude_extensions=["log"])
+            exact = ScanConfig(exclude_extensions=["log"], case_sensitive_extensions=True)
+
+            folded_names = {f.path.name for f in scanner._scan_directory_with_config(temp_path, folded)}
+            exact_names = {f.path.name for f in scanner._scan_directory_with_config(temp_path, exact)}
+
+            assert _config_filters(folded).suffixes == {".log"}
+            assert folded_names == {"keep.txt"}
+            assert exact_names == {"UPPER.LOG", "keep.txt"}